@@ -1,4 +1,5 @@
 # app.py - Complete version with year-based data structure support
+import heapq
 import json
 import os
 from collections import defaultdict
@@ -19,6 +20,7 @@ CREDENTIALS_PATH = None  # Use None for default credentials (uses Application De
 DEFAULT_YEAR = "2024"  # Default year to load
 DATA_SOURCE = os.getenv('DATA_SOURCE', 'gcs').lower()  # 'fortune10' or 'gcs'
 ALLOW_SAMPLE_FALLBACK = os.getenv('ALLOW_SAMPLE_FALLBACK', 'false').lower() == 'true'
+CSV_CACHE_DIR = os.getenv('CSV_CACHE_DIR')  # Optional local cache for downloaded CSVs
 
 # Role archetypes for position leader board
 ROLE_CATEGORY_RULES = [
@@ -64,7 +66,7 @@ ROLE_CATEGORY_RULES = [
 folder_loader: Optional[CompanyFolderLoader] = None
 if DATA_SOURCE == 'gcs':
     print("Configured to load company data from GCS bucket")
-    folder_loader = CompanyFolderLoader(BUCKET_NAME, CREDENTIALS_PATH)
+    folder_loader = CompanyFolderLoader(BUCKET_NAME, CREDENTIALS_PATH, cache_dir=CSV_CACHE_DIR)
 
 FALLBACK_AVAILABLE_YEARS: Set[str] = set()
 USING_SAMPLE_DATA = DATA_SOURCE == 'fortune10'
@@ -75,7 +77,7 @@ def load_fortune10_sample_dataset() -> LeagueManager:
     global FALLBACK_AVAILABLE_YEARS, USING_SAMPLE_DATA
     try:
         league, years = load_fortune10_league()
-        FALLBACK_AVAILABLE_YEARS = {str(year.year) for year in years}
+        FALLBACK_AVAILABLE_YEARS = {str(year) for year in years}
         USING_SAMPLE_DATA = True
         print("Loaded Fortune 10 sample dataset for local development.")
         return league
@@ -322,15 +324,18 @@ def index():
         if len(top_exec_owners) >= 5 and len(top_director_owners) >= 5:
             break
 
-    comp_records_sorted = sorted(
-        [
-            (record, league_manager.get_company(record.company_id), league_manager.get_person(record.person_id))
-            for record in league_manager.executive_comp
+    top_comp_records = heapq.nlargest(
+        5,
+        (
+            record for record in league_manager.executive_comp
             if dates_share_year(record.fiscal_year_end, year_date)
-        ],
-        key=lambda triple: triple[0].total_comp_usd,
-        reverse=True
+        ),
+        key=lambda record: record.total_comp_usd,
     )
+    top_comp_triples = [
+        (record, league_manager.get_company(record.company_id), league_manager.get_person(record.person_id))
+        for record in top_comp_records
+    ]
     top_paid_execs = [
         {
             'person_id': person.person_id,
@@ -341,7 +346,7 @@ def index():
             'title': person.current_title,
             'total_compensation': record.total_comp_usd,
         }
-        for record, company, person in comp_records_sorted[:5]
+        for record, company, person in top_comp_triples
         if company and person
     ]
 
@@ -696,11 +701,7 @@ def company_detail(company_id):
         'total_shares': total_insider_shares,
     }
 
-    top_owner_rows = sorted(
-        ownership_rows,
-        key=lambda row: row['total_shares'],
-        reverse=True
-    )[:6]
+    top_owner_rows = heapq.nlargest(6, ownership_rows, key=lambda row: row['total_shares'])
     top_owner_chart = {
         'labels': [row['holder_name'] for row in top_owner_rows],
         'shares': [row['total_shares'] for row in top_owner_rows],
@@ -781,7 +782,8 @@ def person_detail(person_id):
         })
 
     total_earnings = sum(rec.total_comp_usd for rec in all_records)
-    years_active = len({rec.fiscal_year_end.year for rec in all_records})
+    active_years = {rec.fiscal_year_end.year for rec in all_records}
+    years_active = len(active_years)
     companies_count = len({rec.company_id for rec in all_records})
     highest_single_year = max((rec.total_comp_usd for rec in all_records), default=0)
     avg_annual = (total_earnings / years_active) if years_active else 0
@@ -794,7 +796,7 @@ def person_detail(person_id):
         'highest_single_year': highest_single_year
     }
 
-    person_years = sorted({str(rec.fiscal_year_end.year) for rec in all_records}, reverse=True)
+    person_years = sorted((str(y) for y in active_years), reverse=True)
 
     person_dict = {
         'person_id': person.person_id,
@@ -821,13 +823,11 @@ def person_detail(person_id):
 
     season_records = compensation_records if year_date else all_records
     season_year_label = str(year_date.year) if year_date else 'Career'
+    season_total = sum(rec.total_comp_usd for rec in season_records)
     season_stats = {
         'year_label': season_year_label,
-        'total': sum(rec.total_comp_usd for rec in season_records),
-        'avg_total': (
-            sum(rec.total_comp_usd for rec in season_records) / len(season_records)
-            if season_records else 0
-        ),
+        'total': season_total,
+        'avg_total': season_total / len(season_records) if season_records else 0,
         'salary': sum(rec.salary_usd for rec in season_records),
         'bonus': sum(rec.bonus_usd for rec in season_records),
         'stock': sum(rec.stock_awards_usd for rec in season_records),
@@ -897,6 +897,8 @@ def refresh_data():
     global league_manager, FALLBACK_AVAILABLE_YEARS, USING_SAMPLE_DATA
 
     if DATA_SOURCE == 'fortune10' or not folder_loader:
+        # The sample league is memoized; drop it so the reload rebuilds it.
+        load_fortune10_league.cache_clear()
         league_manager = load_fortune10_sample_dataset()
         return "Sample Fortune 10 data reloaded. Switch DATA_SOURCE to 'gcs' once you migrate to Firebase or cloud storage."
 
@@ -955,21 +957,18 @@ def list_company_folders():
         })
 
     try:
-        folders = folder_loader.list_company_folders()
+        catalog = folder_loader.list_company_catalog()
+        folders = sorted(catalog)
         company_files = {}
         company_years = {}
 
         for company in folders:
-            # Get years for this company
-            years = folder_loader.list_years_for_company(company)
-            company_years[company] = years
-
-            # Get files for each year
-            company_files[company] = {}
-            for year in years:
-                files = folder_loader.list_excel_files_for_company_year(company, year)
-                if year in files['by_year']:
-                    company_files[company][year] = files['by_year'][year]
+            files_by_year = catalog[company]
+            company_years[company] = sorted(files_by_year)
+            company_files[company] = {
+                year: [blob.name for blob in blobs]
+                for year, blobs in files_by_year.items()
+            }
 
         response = {
             'folders': folders,
@@ -1089,7 +1088,8 @@ def diagnostic():
     try:
         # Check GCS connection
         from google.cloud import storage
-        client = storage.Client()
+        # Reuse the loader's client so it picks up CREDENTIALS_PATH.
+        client = folder_loader.client if folder_loader else storage.Client()
         bucket = client.bucket(BUCKET_NAME)
 
         # List files in bucket
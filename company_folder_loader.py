@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import base64
 import csv
 import io
+import json
 import logging
 import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Dict, Iterable, List, Optional, Set
+from functools import lru_cache
+from typing import AbstractSet, BinaryIO, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote
 
 from google.cloud import storage
 
@@ -27,22 +38,64 @@ from models import (
 logger = logging.getLogger(__name__)
 
 CSV_SUFFIX = ".csv"
+# Every CSV below companies/<slug>/<year>/, matched server-side (any case).
+CSV_GLOB = "companies/**.[cC][sS][vV]"
+# Partial responses for listings: downloads only need the name, and the md5
+# keys the local cache. nextPageToken must be kept for pagination to work.
+BLOB_LISTING_FIELDS = "items(name,md5Hash),nextPageToken"
+# How long a catalog listing is reused before GCS is listed again.
+CATALOG_TTL_SECONDS = 600
+# Maps blob name -> cached file so superseded copies can be removed.
+CACHE_INDEX_FILE = "index.json"
+# CSV downloads are network-bound, so a load fetches files concurrently. Kept
+# within the client's default pool of 10 connections so keep-alives are reused.
+DOWNLOAD_WORKERS = 10
 
+# Placeholder strings that spreadsheets export for missing numbers.
+_NA_STRINGS = frozenset({"", "na", "n/a", "none"})
 
-def _slugify(value: str) -> str:
-    import re
+# Fast path for the common ``YYYY-MM-DD`` (padding optional) and US
+# ``MM/DD/YYYY`` dates; anything else falls back to the stdlib parsers.
+_DATE_RE = re.compile(r"^\s*(?:(\d{4})-(\d{1,2})-(\d{1,2})|(\d{1,2})/(\d{1,2})/(\d{4}))\s*$")
+
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+# One client per credentials file, shared by every loader in the process.
+_clients: Dict[Optional[str], storage.Client] = {}
+
+
+def _storage_client(credentials_path: Optional[str]) -> storage.Client:
+    client = _clients.get(credentials_path)
+    if client is None:
+        if credentials_path:
+            client = storage.Client.from_service_account_json(credentials_path)
+        else:
+            client = storage.Client()
+        _clients[credentials_path] = client
+    return client
 
-    slug = re.sub(r"[^a-z0-9]+", "_", value.lower()).strip("_")
+
+# The same names recur across every file of a company-year, so memoize.
+@lru_cache(maxsize=4096)
+def _slugify(value: str) -> str:
+    slug = _NON_SLUG_RE.sub("_", value.lower()).strip("_")
     return slug or "unknown"
 
 
 def _to_float(value) -> float:
-    if value is None:
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is str:
+        text = value.strip()
+    elif value is None:
         return 0.0
-    if isinstance(value, (int, float)):
+    elif isinstance(value, (int, float)):
         return float(value)
-    text = str(value).strip()
-    if text == "" or text.lower() in {"na", "n/a", "none"}:
+    else:
+        text = str(value).strip()
+    if text.lower() in _NA_STRINGS:
         return 0.0
     text = text.replace(",", "").replace("$", "")
     try:
@@ -52,12 +105,18 @@ def _to_float(value) -> float:
 
 
 def _to_int(value) -> int:
-    if value is None:
+    value_type = type(value)
+    if value_type is int:
+        return value
+    if value_type is str:
+        text = value.strip()
+    elif value is None:
         return 0
-    if isinstance(value, int):
+    elif isinstance(value, int):
         return value
-    text = str(value).strip()
-    if text == "" or text.lower() in {"na", "n/a", "none"}:
+    else:
+        text = str(value).strip()
+    if text.lower() in _NA_STRINGS:
         return 0
     text = text.replace(",", "")
     try:
@@ -78,17 +137,101 @@ def _to_bool(value) -> bool:
 def _parse_date(value: Optional[str], fallback: Optional[date] = None) -> Optional[date]:
     if not value:
         return fallback
-    text = str(value).strip()
+    text = str(value)
+    match = _DATE_RE.match(text)
+    if match:
+        iso_year, iso_month, iso_day, us_month, us_day, us_year = match.groups()
+        try:
+            if iso_year:
+                return date(int(iso_year), int(iso_month), int(iso_day))
+            return date(int(us_year), int(us_month), int(us_day))
+        except ValueError:
+            return fallback
+    # Other ISO forms date.fromisoformat accepts, such as "20240131".
+    text = text.strip()
     try:
         return date.fromisoformat(text)
     except ValueError:
+        pass
+    for pattern in ("%Y-%m-%d", "%m/%d/%Y"):
         try:
-            return datetime.strptime(text, "%Y-%m-%d").date()
+            return datetime.strptime(text, pattern).date()
         except ValueError:
-            try:
-                return datetime.strptime(text, "%m/%d/%Y").date()
-            except ValueError:
-                return fallback
+            pass
+    return fallback
+
+
+def _csv_kind(blob_name: str) -> Optional[str]:
+    """Return which dataset a CSV holds, based on its file name."""
+    filename = blob_name.rpartition("/")[2].lower()
+    if not filename.endswith(CSV_SUFFIX):
+        return None
+    if filename.endswith("_manifest.csv"):
+        return "manifest"
+    if "executive_compensation" in filename:
+        return "executive_compensation"
+    if "executive_equity_grants" in filename:
+        return "equity_grants"
+    if "beneficial_ownership" in filename:
+        return "beneficial_ownership"
+    if "director_compensation" in filename:
+        return "director_compensation"
+    if "director_comp_policy" in filename or "director_compensation_policy" in filename:
+        return "director_policy"
+    if "directors_profiles" in filename or "director_profiles" in filename:
+        return "director_profiles"
+    return None
+
+
+def _decode_lines(stream: Iterable[bytes]) -> Iterator[str]:
+    # Exports are normally UTF-8; older spreadsheets occasionally save Latin-1.
+    for line in stream:
+        try:
+            yield line.decode("utf-8")
+        except UnicodeDecodeError:
+            yield line.decode("latin-1")
+
+
+def _read_rows(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+    """Yield stripped rows keyed by the stripped header, like a DictReader.
+
+    The header is cleaned once up front and each row is built with a single
+    zip; ragged rows keep DictReader's None padding and overflow list.
+    """
+    reader = csv.reader(lines)
+    header = next(reader, None)
+    if header is None:
+        return
+    fieldnames = [name.strip() for name in header]
+    width = len(fieldnames)
+    strip = str.strip
+    if len(set(fieldnames)) < width:
+        # Duplicate columns: keep whichever one DictReader would have kept.
+        winners = {raw: index for index, raw in enumerate(header)}
+        columns = {name.strip(): index for name, index in winners.items()}
+        for values in reader:
+            if values:
+                count = len(values)
+                row = {name: strip(values[index]) if index < count else None for name, index in columns.items()}
+                if count > width:
+                    row[None] = values[width:]
+                yield row
+        return
+    for values in reader:
+        if not values:
+            continue
+        row = dict(zip(fieldnames, map(strip, values)))
+        if len(values) > width:
+            row[None] = values[width:]
+        elif len(values) < width:
+            for name in fieldnames[len(values):]:
+                row[name] = None
+        yield row
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    # Sources, award types, roles, units, tickers and sectors repeat across rows; keep one copy of each.
+    return sys.intern(value) if value else value
 
 
 def _get_first(row: Dict[str, str], keys: Iterable[str], default=None):
@@ -112,75 +255,197 @@ def _get_int(row: Dict[str, str], *keys: str, default: Optional[int] = 0) -> Opt
     return default
 
 
+def _import_order(blobs: List[storage.Blob]) -> List[storage.Blob]:
+    """Return the CSVs load_company_year reads, in the order it reads them."""
+    manifest = next((blob for blob in blobs if _csv_kind(blob.name) == "manifest"), None)
+    ordered = [manifest] if manifest else []
+    ordered.extend(blob for blob in blobs if _csv_kind(blob.name) not in (None, "manifest"))
+    return ordered
+
+
 class CompanyFolderLoader:
     """Load CSV data from company/year organized folders in GCS bucket."""
 
-    def __init__(self, bucket_name: str, credentials_path: Optional[str] = None):
+    def __init__(
+        self,
+        bucket_name: str,
+        credentials_path: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+    ):
         self.bucket_name = bucket_name
-        if credentials_path:
-            os.environ["GOOGLE_APPLICATION_CREDENTIALS"] = credentials_path
-
-        self.client = storage.Client()
+        self.client = _storage_client(credentials_path)
         self.bucket = self.client.bucket(bucket_name)
 
+        # Optional local copy of downloaded CSVs, keyed by the blob's MD5 so
+        # unchanged files are never fetched twice.
+        self.cache_dir = cache_dir
+        self._cache_lock = threading.Lock()
+        self._cache_index: Dict[str, str] = {}
+        self._catalog: Optional[Dict[str, Dict[str, List[storage.Blob]]]] = None
+        self._catalog_listed_at = 0.0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._cache_index = self._load_cache_index()
+
         self.league_manager = LeagueManager()
         self.load_warnings: List[str] = []
+        # Held for a whole load_all_company_data call: the league, warnings and
+        # prefetch state below belong to one load at a time.
+        self._load_lock = threading.Lock()
+        self._prefetched: Dict[str, Future] = {}
+        self._prefetch_queue: Deque[storage.Blob] = deque()
+        self._prefetch_window = DOWNLOAD_WORKERS
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     # ------------------------------------------------------------------
     # Discovery helpers
     # ------------------------------------------------------------------
 
-    def list_company_folders(self) -> List[str]:
-        folders: Set[str] = set()
-        for blob in self.bucket.list_blobs(prefix="companies/"):
+    def list_company_catalog(self, refresh: bool = False) -> Dict[str, Dict[str, List[storage.Blob]]]:
+        """Group every company CSV by slug and year using a single listing.
+
+        The result is reused for ``CATALOG_TTL_SECONDS`` unless ``refresh`` is set.
+        """
+        if (
+            not refresh
+            and self._catalog is not None
+            and time.monotonic() - self._catalog_listed_at < CATALOG_TTL_SECONDS
+        ):
+            return self._catalog
+
+        catalog: Dict[str, Dict[str, List[storage.Blob]]] = {}
+        for blob in self.client.list_blobs(
+            self.bucket, match_glob=CSV_GLOB, fields=BLOB_LISTING_FIELDS
+        ):
             parts = blob.name.split("/")
-            if len(parts) >= 2 and parts[0] == "companies" and parts[1]:
-                folders.add(parts[1])
-        return sorted(folders)
+            if len(parts) < 4 or not parts[1]:
+                continue
+            year = parts[2]
+            if year.isdigit() and len(year) == 4:
+                catalog.setdefault(parts[1], {}).setdefault(year, []).append(blob)
+        self._catalog = catalog
+        self._catalog_listed_at = time.monotonic()
+        return catalog
 
     def list_years_for_company(self, company_slug: str) -> List[str]:
-        years: Set[str] = set()
-        prefix = f"companies/{company_slug}/"
-        for blob in self.bucket.list_blobs(prefix=prefix):
-            parts = blob.name.split("/")
-            if len(parts) >= 3 and parts[0] == "companies" and parts[1] == company_slug:
-                year = parts[2]
-                if year.isdigit() and len(year) == 4:
-                    years.add(year)
-        return sorted(years)
+        return sorted(self.list_company_catalog().get(company_slug, {}))
 
     # ------------------------------------------------------------------
     # CSV ingestion
     # ------------------------------------------------------------------
 
-    def _read_csv_blob(self, blob_name: str) -> List[Dict[str, str]]:
-        blob = self.bucket.blob(blob_name)
+    def _cache_path(self, blob: storage.Blob) -> Optional[str]:
+        if not self.cache_dir or not blob.md5_hash:
+            return None
+        digest = base64.b64decode(blob.md5_hash).hex()
+        # The full (escaped) blob path keeps identical files from different
+        # folders apart, so replacing one never deletes the other's copy.
+        return os.path.join(self.cache_dir, f"{digest}_{quote(blob.name, safe='')}")
+
+    def _load_cache_index(self) -> Dict[str, str]:
         try:
+            with open(os.path.join(self.cache_dir, CACHE_INDEX_FILE), encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache_index(self, live_blobs: Optional[AbstractSet[str]] = None) -> None:
+        """Persist the cache index, first dropping blobs absent from ``live_blobs``."""
+        if not self.cache_dir:
+            return
+        index_path = os.path.join(self.cache_dir, CACHE_INDEX_FILE)
+        with self._cache_lock:
+            stale: List[str] = []
+            if live_blobs is not None:
+                for blob_name in [name for name in self._cache_index if name not in live_blobs]:
+                    stale.append(self._cache_index.pop(blob_name))
+            snapshot = dict(self._cache_index)
+        # Files for blobs deleted from the bucket are never read again.
+        for filename in stale:
             try:
-                contents = blob.download_as_text(encoding="utf-8")
-            except UnicodeDecodeError:
-                contents = blob.download_as_text(encoding="latin-1")
+                os.remove(os.path.join(self.cache_dir, filename))
+            except OSError:
+                pass
+        try:
+            with open(f"{index_path}.tmp", "w", encoding="utf-8") as handle:
+                json.dump(snapshot, handle, indent=0, sort_keys=True)
+            os.replace(f"{index_path}.tmp", index_path)
+        except OSError as exc:
+            logger.warning("Unable to write cache index: %s", exc)
+
+    def _remember_cached_file(self, blob_name: str, cache_path: str) -> None:
+        filename = os.path.basename(cache_path)
+        with self._cache_lock:
+            previous = self._cache_index.get(blob_name)
+            self._cache_index[blob_name] = filename
+        if previous and previous != filename:
+            try:
+                os.remove(os.path.join(self.cache_dir, previous))
+            except OSError:
+                pass
+
+    def _open_blob(self, blob: storage.Blob) -> BinaryIO:
+        cache_path = self._cache_path(blob)
+        if cache_path:
+            if os.path.exists(cache_path):
+                logger.debug("Using cached copy of %s", blob.name)
+                self._remember_cached_file(blob.name, cache_path)
+                return open(cache_path, "rb")
+            handle, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(handle)
+            try:
+                blob.download_to_filename(temp_path)
+                os.replace(temp_path, cache_path)
+            except OSError as exc:
+                logger.warning("Unable to cache %s: %s", blob.name, exc)
+            else:
+                self._remember_cached_file(blob.name, cache_path)
+                return open(cache_path, "rb")
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+        # BlobReader has no peek(), so buffer it to keep line iteration cheap.
+        return io.BufferedReader(blob.open("rb"))
+
+    def _read_csv_blob(self, blob: storage.Blob) -> List[Dict[str, str]]:
+        future = self._prefetched.pop(blob.name, None)
+        if future is not None:
+            self._prefetch_more()
+            rows, warnings = future.result()
+        else:
+            rows, warnings = self._fetch_csv_rows(blob)
+        # Warnings are recorded here, in import order, not by the worker threads.
+        self.load_warnings.extend(warnings)
+        return rows
+
+    def _prefetch_more(self) -> None:
+        # Keep only a bounded window of files downloaded ahead of the import.
+        while self._prefetch_queue and len(self._prefetched) < self._prefetch_window:
+            blob = self._prefetch_queue.popleft()
+            self._prefetched[blob.name] = self._executor.submit(self._fetch_csv_rows, blob)
+
+    def _fetch_csv_rows(self, blob: storage.Blob) -> Tuple[List[Dict[str, str]], List[str]]:
+        """Return every row of ``blob`` (or none if it cannot be read in full) and its warnings."""
+        try:
+            with self._open_blob(blob) as stream:
+                rows = list(_read_rows(_decode_lines(stream)))
+        except csv.Error as exc:
+            message = f"Failed to parse {blob.name}: {exc}"
+            logger.warning(message)
+            return [], [message]
         except Exception as exc:
-            message = f"Failed to download {blob_name}: {exc}"
+            message = f"Failed to download {blob.name}: {exc}"
             logger.warning(message)
-            self.load_warnings.append(message)
-            return []
+            return [], [message]
 
-        reader = csv.DictReader(io.StringIO(contents))
-        rows = [
-            {
-                (k.strip() if isinstance(k, str) else k): (v.strip() if isinstance(v, str) else v)
-                for k, v in row.items()
-            }
-            for row in reader
-        ]
         if not rows:
-            message = f"No rows found in {blob_name}"
+            message = f"No rows found in {blob.name}"
             logger.warning(message)
-            self.load_warnings.append(message)
-        else:
-            logger.debug("Loaded %s rows from %s", len(rows), blob_name)
-        return rows
+            return rows, [message]
+
+        logger.debug("Loaded %s rows from %s", len(rows), blob.name)
+        return rows, []
 
     def _ensure_company(self, company_slug: str, manifest_row: Dict[str, str], year: str) -> Company:
         company = self.league_manager.get_company(company_slug)
@@ -193,28 +458,28 @@ class CompanyFolderLoader:
             company = Company(
                 company_id=company_slug,
                 company_name=manifest_row.get("company_name", company_slug.replace("-", " ").title()),
-                ticker=manifest_row.get("ticker", manifest_row.get("stock_ticker", "UNK")),
+                ticker=_intern(manifest_row.get("ticker", manifest_row.get("stock_ticker", "UNK"))),
                 fiscal_year_end=fiscal_year_end or date(int(year), 12, 31),
                 source_url=manifest_row.get("source_url", ""),
                 notes=manifest_row.get("notes"),
                 market_cap_usd=_to_float(manifest_row.get("market_cap_usd")),
                 revenue_usd=_to_float(manifest_row.get("revenue_usd")),
                 cap_budget_usd=_to_float(manifest_row.get("cap_budget_usd")),
-                sector=manifest_row.get("sector"),
+                sector=_intern(manifest_row.get("sector")),
                 founded_year=_to_int(manifest_row.get("founded_year")),
             )
             self.league_manager.add_company(company)
         else:
             # Update mutable fields if new information arrives
             company.company_name = manifest_row.get("company_name", company.company_name)
-            company.ticker = manifest_row.get("ticker", company.ticker)
+            company.ticker = _intern(manifest_row.get("ticker", company.ticker))
             company.fiscal_year_end = fiscal_year_end or company.fiscal_year_end
             company.source_url = manifest_row.get("source_url", company.source_url)
             company.notes = manifest_row.get("notes", company.notes)
             company.market_cap_usd = _to_float(manifest_row.get("market_cap_usd")) or company.market_cap_usd
             company.revenue_usd = _to_float(manifest_row.get("revenue_usd")) or company.revenue_usd
             company.cap_budget_usd = _to_float(manifest_row.get("cap_budget_usd")) or company.cap_budget_usd
-            company.sector = manifest_row.get("sector", company.sector)
+            company.sector = _intern(manifest_row.get("sector", company.sector))
             founded_year = _to_int(manifest_row.get("founded_year"))
             company.founded_year = founded_year or company.founded_year
 
@@ -272,8 +537,9 @@ class CompanyFolderLoader:
 
         return person
 
-    def _import_manifest(self, company_slug: str, year: str, blob_name: str) -> Dict[str, str]:
-        rows = self._read_csv_blob(blob_name)
+    def _import_manifest(self, company_slug: str, year: str, blob: storage.Blob) -> Dict[str, str]:
+        rows = self._read_csv_blob(blob)
+        staged: List[SourceManifestEntry] = []
         manifest = rows[0] if rows else {}
         for row in rows:
             entry = SourceManifestEntry(
@@ -282,7 +548,8 @@ class CompanyFolderLoader:
                 description=row.get("description") or row.get("what") or "",
                 last_updated=_parse_date(row.get("last_updated"), fallback=date.today()) or date.today(),
             )
-            self.league_manager.add_source_manifest_entry(entry)
+            staged.append(entry)
+        self.league_manager.extend_source_manifest(staged)
         manifest.setdefault("company_name", manifest.get("name"))
         manifest.setdefault("ticker", manifest.get("symbol"))
         manifest.setdefault("fiscal_year_end", manifest.get("year_end"))
@@ -293,14 +560,17 @@ class CompanyFolderLoader:
         self,
         company: Company,
         year: str,
-        blob_name: str,
+        blob: storage.Blob,
     ) -> None:
-        rows = self._read_csv_blob(blob_name)
+        rows = self._read_csv_blob(blob)
+        ensure_person = self._ensure_person
+        default_source = f"{year} Proxy Statement"
+        staged: List[ExecutiveCompensation] = []
         for row in rows:
             full_name = _get_first(row, ["full_name", "executive_name", "name"], default="")
             if not full_name:
                 continue
-            person = self._ensure_person(
+            person = ensure_person(
                 row.get("person_id"),
                 full_name,
                 current_title=_get_first(row, ["current_title", "title", "position"], default=""),
@@ -354,17 +624,21 @@ class CompanyFolderLoader:
                 pension_change_usd=pension_change_usd,
                 all_other_comp_usd=all_other_usd,
                 total_comp_usd=total_comp,
-                source=row.get("source", f"{year} Proxy Statement"),
+                source=_intern(row.get("source", default_source)),
             )
-            self.league_manager.add_executive_comp(record)
-
-    def _import_equity_grants(self, company: Company, blob_name: str) -> None:
-        rows = self._read_csv_blob(blob_name)
+            staged.append(record)
+        self.league_manager.extend_executive_comp(staged)
+
+    def _import_equity_grants(self, company: Company, blob: storage.Blob) -> None:
+        rows = self._read_csv_blob(blob)
+        ensure_person = self._ensure_person
+        default_source = f"{company.fiscal_year_end.year} Plan-Based Awards"
+        staged: List[ExecutiveEquityGrant] = []
         for row in rows:
             full_name = _get_first(row, ["full_name", "executive_name", "name"], default="")
             if not full_name:
                 continue
-            person = self._ensure_person(
+            person = ensure_person(
                 row.get("person_id"),
                 full_name,
                 current_title=_get_first(row, ["current_title", "title"], default=""),
@@ -380,23 +654,26 @@ class CompanyFolderLoader:
                 company_id=company.company_id,
                 person_id=person.person_id,
                 grant_date=grant_date or company.fiscal_year_end,
-                award_type=row.get("type", row.get("award_type", "")),
+                award_type=_intern(row.get("type", row.get("award_type", ""))),
                 threshold_units=threshold_units,
                 target_units=target_units,
                 max_units=max_units,
                 grant_date_fair_value_usd=_get_float(row, "grant_date_fair_value_usd", "grant_date_value_usd"),
                 vesting_schedule_short=row.get("vesting_schedule_short", row.get("vesting_schedule")),
-                source=row.get("source", f"{company.fiscal_year_end.year} Plan-Based Awards"),
+                source=_intern(row.get("source", default_source)),
             )
-            self.league_manager.add_equity_grant(record)
+            staged.append(record)
+        self.league_manager.extend_equity_grants(staged)
 
-    def _import_beneficial_ownership(self, company: Company, blob_name: str) -> None:
-        rows = self._read_csv_blob(blob_name)
+    def _import_beneficial_ownership(self, company: Company, blob: storage.Blob) -> None:
+        rows = self._read_csv_blob(blob)
+        ensure_person = self._ensure_person
+        staged: List[BeneficialOwnershipRecord] = []
         for row in rows:
             full_name = _get_first(row, ["full_name", "name"], default="")
             if not full_name:
                 continue
-            person = self._ensure_person(
+            person = ensure_person(
                 row.get("person_id"),
                 full_name,
                 current_title=_get_first(row, ["current_title", "role", "title"], default=""),
@@ -406,7 +683,7 @@ class CompanyFolderLoader:
             record = BeneficialOwnershipRecord(
                 company_id=company.company_id,
                 person_id=person.person_id,
-                role=_get_first(row, ["role", "title"], default=person.current_title),
+                role=_intern(_get_first(row, ["role", "title"], default=person.current_title)),
                 total_shares=_get_int(row, "total_shares", "total_shares_owned", "total_beneficial_ownership"),
                 sole_voting_power=_get_int(row, "sole_voting_power", "direct_or_indirect_sole_voting", "ownership_of_common_stock"),
                 shared_voting_power=_get_int(row, "shared_voting_power", "indirect_shared_voting", "equity_awards_exercisable_or_vesting_within_60d"),
@@ -414,15 +691,19 @@ class CompanyFolderLoader:
                 as_of_date=_parse_date(row.get("as_of_date"), fallback=company.fiscal_year_end) or company.fiscal_year_end,
                 notes=row.get("notes"),
             )
-            self.league_manager.add_beneficial_ownership(record)
-
-    def _import_director_compensation(self, company: Company, blob_name: str) -> None:
-        rows = self._read_csv_blob(blob_name)
+            staged.append(record)
+        self.league_manager.extend_beneficial_ownership(staged)
+
+    def _import_director_compensation(self, company: Company, blob: storage.Blob) -> None:
+        rows = self._read_csv_blob(blob)
+        ensure_person = self._ensure_person
+        default_source = f"{company.fiscal_year_end.year} Director Compensation"
+        staged: List[DirectorCompensation] = []
         for row in rows:
             full_name = _get_first(row, ["full_name", "director_name", "name"], default="")
             if not full_name:
                 continue
-            person = self._ensure_person(
+            person = ensure_person(
                 row.get("person_id"),
                 full_name,
                 current_title=_get_first(row, ["role", "title"], default="Director"),
@@ -437,16 +718,20 @@ class CompanyFolderLoader:
                 stock_awards_usd=_get_float(row, "stock_awards_usd", "stock_grant_usd"),
                 all_other_comp_usd=_get_float(row, "all_other_comp_usd", "all_other_compensation_usd"),
                 total_usd=_get_float(row, "total_usd", "total_comp_usd", "total_compensation_usd"),
-                source=row.get("source", f"{company.fiscal_year_end.year} Director Compensation"),
+                source=_intern(row.get("source", default_source)),
             )
-            self.league_manager.add_director_comp(record)
-    def _import_director_profiles(self, company: Company, blob_name: str) -> None:
-        rows = self._read_csv_blob(blob_name)
+            staged.append(record)
+        self.league_manager.extend_director_comp(staged)
+
+    def _import_director_profiles(self, company: Company, blob: storage.Blob) -> None:
+        rows = self._read_csv_blob(blob)
+        ensure_person = self._ensure_person
+        staged: List[DirectorProfile] = []
         for row in rows:
             full_name = _get_first(row, ["full_name", "director_name", "name"], default="")
             if not full_name:
                 continue
-            person = self._ensure_person(
+            person = ensure_person(
                 row.get("person_id"),
                 full_name,
                 current_title=_get_first(row, ["role", "title"], default="Director"),
@@ -455,7 +740,7 @@ class CompanyFolderLoader:
             profile = DirectorProfile(
                 company_id=company.company_id,
                 person_id=person.person_id,
-                role=_get_first(row, ["role", "title"], default=person.current_title),
+                role=_intern(_get_first(row, ["role", "title"], default=person.current_title)),
                 independent=_to_bool(row.get("independent", row.get("is_independent", True))),
                 director_since=_get_int(row, "director_since", default=None),
                 lead_independent_director=_to_bool(row.get("lead_independent_director", row.get("lead_independent", False))),
@@ -463,10 +748,12 @@ class CompanyFolderLoader:
                 primary_occupation=row.get("primary_occupation", row.get("occupation")),
                 other_public_boards=row.get("other_public_boards"),
             )
-            self.league_manager.add_director_profile(profile)
+            staged.append(profile)
+        self.league_manager.extend_director_profiles(staged)
 
-    def _import_director_policy_file(self, company: Company, blob_name: str) -> None:
-        rows = self._read_csv_blob(blob_name)
+    def _import_director_policy_file(self, company: Company, blob: storage.Blob) -> None:
+        rows = self._read_csv_blob(blob)
+        staged: List[DirectorCompPolicy] = []
         for row in rows:
             component = _get_first(row, ["component", "policy_item"], default="")
             if not component:
@@ -475,18 +762,25 @@ class CompanyFolderLoader:
                 company_id=company.company_id,
                 component=component,
                 amount_usd=_get_float(row, "amount_usd", "value_usd"),
-                unit=row.get("unit"),
+                unit=_intern(row.get("unit")),
                 notes=row.get("notes"),
             )
-            self.league_manager.add_director_policy(policy)
+            staged.append(policy)
+        self.league_manager.extend_director_policies(staged)
 
 # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
-    def load_company_year(self, company_slug: str, year: str) -> None:
-        prefix = f"companies/{company_slug}/{year}/"
-        blobs = list(self.bucket.list_blobs(prefix=prefix))
+    def load_company_year(
+        self,
+        company_slug: str,
+        year: str,
+        blobs: Optional[List[storage.Blob]] = None,
+    ) -> None:
+        if blobs is None:
+            prefix = f"companies/{company_slug}/{year}/"
+            blobs = list(self.bucket.list_blobs(prefix=prefix, fields=BLOB_LISTING_FIELDS))
         if not blobs:
             message = f"No files found for {company_slug} {year}"
             logger.info(message)
@@ -495,9 +789,8 @@ class CompanyFolderLoader:
 
         manifest_row: Dict[str, str] = {}
         for blob in blobs:
-            filename = blob.name.split("/")[-1].lower()
-            if filename.endswith("_manifest.csv"):
-                manifest_row = self._import_manifest(company_slug, year, blob.name)
+            if _csv_kind(blob.name) == "manifest":
+                manifest_row = self._import_manifest(company_slug, year, blob)
                 break
 
         if not manifest_row:
@@ -509,31 +802,25 @@ class CompanyFolderLoader:
 
         recognized_files = 0
         for blob in blobs:
-            filename = blob.name.split("/")[-1].lower()
-            if not filename.endswith(CSV_SUFFIX):
+            kind = _csv_kind(blob.name)
+            if kind == "manifest":
                 continue
-            if filename.endswith("_manifest.csv"):
-                continue
-            if "executive_compensation" in filename:
-                self._import_executive_compensation(company, year, blob.name)
-                recognized_files += 1
-            elif "executive_equity_grants" in filename:
-                self._import_equity_grants(company, blob.name)
-                recognized_files += 1
-            elif "beneficial_ownership" in filename:
-                self._import_beneficial_ownership(company, blob.name)
-                recognized_files += 1
-            elif "director_compensation" in filename:
-                self._import_director_compensation(company, blob.name)
-                recognized_files += 1
-            elif "director_comp_policy" in filename or "director_compensation_policy" in filename:
-                self._import_director_policy_file(company, blob.name)
-                recognized_files += 1
-            elif "directors_profiles" in filename or "director_profiles" in filename:
-                self._import_director_profiles(company, blob.name)
-                recognized_files += 1
+            if kind == "executive_compensation":
+                self._import_executive_compensation(company, year, blob)
+            elif kind == "equity_grants":
+                self._import_equity_grants(company, blob)
+            elif kind == "beneficial_ownership":
+                self._import_beneficial_ownership(company, blob)
+            elif kind == "director_compensation":
+                self._import_director_compensation(company, blob)
+            elif kind == "director_policy":
+                self._import_director_policy_file(company, blob)
+            elif kind == "director_profiles":
+                self._import_director_profiles(company, blob)
             else:
                 logger.debug("Skipping unrecognized file %s", blob.name)
+                continue
+            recognized_files += 1
 
         if recognized_files == 0:
             message = f"No recognized CSVs for {company_slug} {year}"
@@ -544,15 +831,39 @@ class CompanyFolderLoader:
         self,
         specific_year: Optional[str] = None,
         load_all_years: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, object]:
+        # Overlapping refreshes (the app serves requests on several threads)
+        # wait for the running load instead of sharing its executor.
+        with self._load_lock:
+            return self._load_all_company_data(specific_year, load_all_years, max_workers)
+
+    def _load_all_company_data(
+        self,
+        specific_year: Optional[str],
+        load_all_years: bool,
+        max_workers: Optional[int],
     ) -> Dict[str, object]:
         self.league_manager = LeagueManager()
 
         self.load_warnings = []
 
+        self._prefetch_window = max_workers or DOWNLOAD_WORKERS
+        self._executor = ThreadPoolExecutor(max_workers=self._prefetch_window)
+        listed_blobs: Optional[AbstractSet[str]] = None
         try:
-            company_slugs = self.list_company_folders()
-            for company_slug in company_slugs:
-                years = self.list_years_for_company(company_slug)
+            # A load always re-lists so freshly uploaded files are picked up.
+            catalog = self.list_company_catalog(refresh=True)
+            listed_blobs = {
+                blob.name
+                for files_by_year in catalog.values()
+                for blobs in files_by_year.values()
+                for blob in blobs
+            }
+            jobs: List[Tuple[str, str, List[storage.Blob]]] = []
+            for company_slug in sorted(catalog):
+                files_by_year = catalog[company_slug]
+                years = sorted(files_by_year)
                 if specific_year and specific_year in years:
                     target_years = [specific_year]
                 elif load_all_years:
@@ -563,8 +874,20 @@ class CompanyFolderLoader:
                     target_years = []
 
                 for year in target_years:
-                    logger.info("Loading %s %s", company_slug, year)
-                    self.load_company_year(company_slug, year)
+                    jobs.append((company_slug, year, files_by_year[year]))
+
+            # Downloads run a bounded window ahead of the import, in the order
+            # load_company_year reads them; importing stays sequential so the
+            # league is built the same way regardless of network timing.
+            self._prefetch_queue = deque(
+                blob
+                for _, _, blobs in jobs
+                for blob in _import_order(blobs)
+            )
+            self._prefetch_more()
+            for company_slug, year, blobs in jobs:
+                logger.info("Loading %s %s", company_slug, year)
+                self.load_company_year(company_slug, year, blobs)
 
             return {
                 "status": "success",
@@ -579,6 +902,13 @@ class CompanyFolderLoader:
         except Exception as exc:
             logger.exception("Failed to load company data: %s", exc)
             return {"status": "error", "message": str(exc), "warnings": self.load_warnings}
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            self._prefetch_queue = deque()
+            self._prefetched = {}
+            # Prune only against a listing taken by this load.
+            self._save_cache_index(listed_blobs)
 
     def get_league_manager(self) -> LeagueManager:
         return self.league_manager
@@ -11,7 +11,7 @@ recent fiscal year available).  The data structures mirror the
 application without additional transformation.
 
 Each `Company` contains a list of executives (instances of
-`Person`) as well as a list of board members (strings).  Each
+`Person`) as well as a tuple of board members (strings).  Each
 `Person` maintains a list of `Role` objects describing their
 position and compensation for a particular year.  Monetary values
 are expressed in US dollars.
@@ -26,14 +26,17 @@ options while others aggregate long‑term equity awards).  Where
 appropriate, stock and option awards have been aggregated into the
 `stock_awards` field and cash incentives (such as non‑equity
 incentive plan payouts) into the `bonus` field.  Signing bonuses
-are recorded separately when disclosed.
+are recorded separately when disclosed, and the proxy tables' "all
+other compensation" column is kept in `other_comp`.
 """
 
+import itertools
 from dataclasses import dataclass, field
-from typing import List, Optional
+from operator import itemgetter
+from typing import Iterator, List, Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Role:
     """Represents a single role an executive holds at a company."""
     person_id: int
@@ -46,13 +49,23 @@ class Role:
     bonus: float
     stock_awards: float
     signing_bonus: float = 0.0
+    other_comp: float = 0.0  # "all other compensation" from the proxy table
+    _total: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Roles are frozen, so the total can be summed once up front.
+        object.__setattr__(
+            self,
+            "_total",
+            self.base_salary + self.bonus + self.stock_awards + self.signing_bonus + self.other_comp,
+        )
 
     def total_compensation(self) -> float:
         """Return the sum of all cash and equity compensation."""
-        return self.base_salary + self.bonus + self.stock_awards + self.signing_bonus
+        return self._total
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """Represents an individual executive and their career history."""
     person_id: int
@@ -68,10 +81,10 @@ class Person:
         self.roles.append(role)
 
     def career_earnings(self) -> float:
-        return sum(r.total_compensation() for r in self.roles)
+        return sum(r._total for r in self.roles)
 
 
-@dataclass
+@dataclass(slots=True)
 class Company:
     """Represents a company in the Fortune 10 list."""
     company_id: int
@@ -83,20 +96,48 @@ class Company:
     exec_budget: Optional[float] = None
     founded: Optional[int] = None
     executives: List[Person] = field(default_factory=list)
-    board_members: List[str] = field(default_factory=list)
+    board_members: Tuple[str, ...] = ()
 
     def add_executive(self, person: Person) -> None:
         self.executives.append(person)
 
 
+_EXEC_FIELDS = itemgetter("name", "title", "base_salary", "bonus", "stock_awards", "other")
+
+
+def _add_executives(company: Company, executives: List[dict], year: int, person_ids: Iterator[int]) -> None:
+    """Attach one Person/Role per executive dict, drawing ids from ``person_ids``."""
+    # executives comes first so zip() stops without drawing a spare id.
+    for exec_data, person_id in zip(executives, person_ids):
+        name, title, base_salary, bonus, stock_awards, other = _EXEC_FIELDS(exec_data)
+        person = Person(person_id=person_id, name=name)
+        person.add_role(
+            Role(
+                person_id=person_id,
+                company_id=company.company_id,
+                title=title,
+                position_type="Executive",
+                year=year,
+                contract_years=1,
+                base_salary=base_salary,
+                bonus=bonus,
+                stock_awards=stock_awards,
+                signing_bonus=0.0,
+                other_comp=other,
+            )
+        )
+        company.add_executive(person)
+
+
 def build_data() -> List[Company]:
-    """Build and return a list of Company objects populated with executives and directors.
+    """Build and return a fresh list of Company objects populated with executives and directors.
 
     Monetary values are rounded to the nearest dollar for clarity.  See the
     accompanying research report for citations supporting the values used
     here.
     """
     companies: List[Company] = []
+    person_ids = itertools.count(1)
 
     # 1. Walmart
     walmart = Company(
@@ -107,7 +148,7 @@ def build_data() -> List[Company]:
         revenue=None,
         market_cap=None,
         founded=1962,
-        board_members=[
+        board_members=(
             "Greg Penner (chair)",
             "Cesar Conde",
             "Timothy P. Flynn",
@@ -120,7 +161,7 @@ def build_data() -> List[Company]:
             "Brian Niccol",
             "Randall Stephenson (lead independent director)",
             "Steuart Walton",
-        ],
+        ),
     )
     # Executives and their 2024 compensation (Talk Business & Politics article)
     walmart_executives = [
@@ -173,24 +214,7 @@ def build_data() -> List[Company]:
             "other": 100_791,
         },
     ]
-    person_id_counter = 1
-    for exec_data in walmart_executives:
-        person = Person(person_id=person_id_counter, name=exec_data["name"])
-        role = Role(
-            person_id=person_id_counter,
-            company_id=walmart.company_id,
-            title=exec_data["title"],
-            position_type="Executive",
-            year=2024,
-            contract_years=1,
-            base_salary=exec_data["base_salary"],
-            bonus=exec_data["bonus"],
-            stock_awards=exec_data["stock_awards"],
-            signing_bonus=0.0,
-        )
-        person.add_role(role)
-        walmart.add_executive(person)
-        person_id_counter += 1
+    _add_executives(walmart, walmart_executives, 2024, person_ids)
     companies.append(walmart)
 
     # 2. Amazon
@@ -200,7 +224,7 @@ def build_data() -> List[Company]:
         ticker="AMZN",
         sector="E‑commerce & Cloud Services",
         founded=1994,
-        board_members=[
+        board_members=(
             "Jeff Bezos (executive chair)",
             "Andy Jassy",
             "Keith B. Alexander",
@@ -213,7 +237,7 @@ def build_data() -> List[Company]:
             "Brad D. Smith",
             "Patricia Q. Stonesifer",
             "Wendell P. Weeks",
-        ],
+        ),
     )
     amazon_executives = [
         {
@@ -257,23 +281,7 @@ def build_data() -> List[Company]:
             "other": 0.0,
         },
     ]
-    for exec_data in amazon_executives:
-        person = Person(person_id=person_id_counter, name=exec_data["name"])
-        role = Role(
-            person_id=person_id_counter,
-            company_id=amazon.company_id,
-            title=exec_data["title"],
-            position_type="Executive",
-            year=2024,
-            contract_years=1,
-            base_salary=exec_data["base_salary"],
-            bonus=exec_data["bonus"],
-            stock_awards=exec_data["stock_awards"],
-            signing_bonus=0.0,
-        )
-        person.add_role(role)
-        amazon.add_executive(person)
-        person_id_counter += 1
+    _add_executives(amazon, amazon_executives, 2024, person_ids)
     companies.append(amazon)
 
     # 3. UnitedHealth Group
@@ -283,7 +291,7 @@ def build_data() -> List[Company]:
         ticker="UNH",
         sector="Healthcare (Insurance)",
         founded=1977,
-        board_members=[
+        board_members=(
             "Andrew Witty (CEO)",
             "Stephen Hemsley (chair)",
             "Michele Hooper (lead independent director)",
@@ -293,7 +301,7 @@ def build_data() -> List[Company]:
             "F. William McNabb III",
             "Valerie Montgomery Rice",
             "John Noseworthy",
-        ],
+        ),
     )
     unitedhealth_executives = [
         {
@@ -345,23 +353,7 @@ def build_data() -> List[Company]:
             "other": 142_835,
         },
     ]
-    for exec_data in unitedhealth_executives:
-        person = Person(person_id=person_id_counter, name=exec_data["name"])
-        role = Role(
-            person_id=person_id_counter,
-            company_id=unitedhealth.company_id,
-            title=exec_data["title"],
-            position_type="Executive",
-            year=2024,
-            contract_years=1,
-            base_salary=exec_data["base_salary"],
-            bonus=exec_data["bonus"],
-            stock_awards=exec_data["stock_awards"],
-            signing_bonus=0.0,
-        )
-        person.add_role(role)
-        unitedhealth.add_executive(person)
-        person_id_counter += 1
+    _add_executives(unitedhealth, unitedhealth_executives, 2024, person_ids)
     companies.append(unitedhealth)
 
     # 4. Apple
@@ -371,7 +363,7 @@ def build_data() -> List[Company]:
         ticker="AAPL",
         sector="Technology",
         founded=1976,
-        board_members=[
+        board_members=(
             "Arthur D. Levinson (chair)",
             "Wanda Austin",
             "Tim Cook",
@@ -380,7 +372,7 @@ def build_data() -> List[Company]:
             "Monica Lozano",
             "Ronald D. Sugar",
             "Susan L. Wagner",
-        ],
+        ),
     )
     apple_executives = [
         {
@@ -424,23 +416,7 @@ def build_data() -> List[Company]:
             "other": 20_737,
         },
     ]
-    for exec_data in apple_executives:
-        person = Person(person_id=person_id_counter, name=exec_data["name"])
-        role = Role(
-            person_id=person_id_counter,
-            company_id=apple.company_id,
-            title=exec_data["title"],
-            position_type="Executive",
-            year=2024,
-            contract_years=1,
-            base_salary=exec_data["base_salary"],
-            bonus=exec_data["bonus"],
-            stock_awards=exec_data["stock_awards"],
-            signing_bonus=0.0,
-        )
-        person.add_role(role)
-        apple.add_executive(person)
-        person_id_counter += 1
+    _add_executives(apple, apple_executives, 2024, person_ids)
     companies.append(apple)
 
     # 5. CVS Health
@@ -450,7 +426,7 @@ def build_data() -> List[Company]:
         ticker="CVS",
         sector="Healthcare (Pharmacy & Health Services)",
         founded=1963,
-        board_members=[
+        board_members=(
             "Fernando Aguirre",
             "Jeffrey R. Balser",
             "C. David Brown II",
@@ -464,7 +440,7 @@ def build_data() -> List[Company]:
             "Larry Robbins",
             "Guy P. Sansone",
             "Douglas H. Shulman",
-        ],
+        ),
     )
     cvs_executives = [
         {
@@ -516,23 +492,7 @@ def build_data() -> List[Company]:
             "other": 85_134,
         },
     ]
-    for exec_data in cvs_executives:
-        person = Person(person_id=person_id_counter, name=exec_data["name"])
-        role = Role(
-            person_id=person_id_counter,
-            company_id=cvs.company_id,
-            title=exec_data["title"],
-            position_type="Executive",
-            year=2024,
-            contract_years=1,
-            base_salary=exec_data["base_salary"],
-            bonus=exec_data["bonus"],
-            stock_awards=exec_data["stock_awards"],
-            signing_bonus=0.0,
-        )
-        person.add_role(role)
-        cvs.add_executive(person)
-        person_id_counter += 1
+    _add_executives(cvs, cvs_executives, 2024, person_ids)
     companies.append(cvs)
 
     # 6. Berkshire Hathaway
@@ -542,7 +502,7 @@ def build_data() -> List[Company]:
         ticker="BRK.A",
         sector="Conglomerate",
         founded=1839,
-        board_members=[
+        board_members=(
             "Warren Buffett (chairman & CEO)",
             "Greg Abel",
             "Ajit Jain",
@@ -554,7 +514,7 @@ def build_data() -> List[Company]:
             "Ted Weschler",
             "Ron Olson",
             "Meryl Witmer",
-        ],
+        ),
     )
     berkshire_executives = [
         {
@@ -582,23 +542,7 @@ def build_data() -> List[Company]:
             "other": 1_000_000,  # estimated other compensation
         },
     ]
-    for exec_data in berkshire_executives:
-        person = Person(person_id=person_id_counter, name=exec_data["name"])
-        role = Role(
-            person_id=person_id_counter,
-            company_id=berkshire.company_id,
-            title=exec_data["title"],
-            position_type="Executive",
-            year=2024,
-            contract_years=1,
-            base_salary=exec_data["base_salary"],
-            bonus=exec_data["bonus"],
-            stock_awards=exec_data["stock_awards"],
-            signing_bonus=0.0,
-        )
-        person.add_role(role)
-        berkshire.add_executive(person)
-        person_id_counter += 1
+    _add_executives(berkshire, berkshire_executives, 2024, person_ids)
     companies.append(berkshire)
 
     # 7. Alphabet (Google)
@@ -608,7 +552,7 @@ def build_data() -> List[Company]:
         ticker="GOOGL",
         sector="Technology",
         founded=2015,  # Alphabet was created as a holding company in 2015
-        board_members=[
+        board_members=(
             "Larry Page",
             "Sergey Brin",
             "Sundar Pichai",
@@ -619,7 +563,7 @@ def build_data() -> List[Company]:
             "Roger W. Ferguson Jr.",
             "K. Ram Shriram",
             "Robin L. Washington",
-        ],
+        ),
     )
     alphabet_executives = [
         {
@@ -671,23 +615,7 @@ def build_data() -> List[Company]:
             "other": 3_020_000,
         },
     ]
-    for exec_data in alphabet_executives:
-        person = Person(person_id=person_id_counter, name=exec_data["name"])
-        role = Role(
-            person_id=person_id_counter,
-            company_id=alphabet.company_id,
-            title=exec_data["title"],
-            position_type="Executive",
-            year=2024,
-            contract_years=1,
-            base_salary=exec_data["base_salary"],
-            bonus=exec_data["bonus"],
-            stock_awards=exec_data["stock_awards"],
-            signing_bonus=0.0,
-        )
-        person.add_role(role)
-        alphabet.add_executive(person)
-        person_id_counter += 1
+    _add_executives(alphabet, alphabet_executives, 2024, person_ids)
     companies.append(alphabet)
 
     # 8. Exxon Mobil
@@ -697,7 +625,7 @@ def build_data() -> List[Company]:
         ticker="XOM",
         sector="Energy",
         founded=1870,
-        board_members=[
+        board_members=(
             "Darren Woods (chairman & CEO)",
             "Joseph L. Hooley (lead independent director)",
             "Susan K. Avery",
@@ -706,7 +634,7 @@ def build_data() -> List[Company]:
             # Additional directors are not listed here due to limited public
             # access during research.  These names represent a subset of the
             # board and were confirmed by credible sources.
-        ],
+        ),
     )
     exxon_executives = [
         {
@@ -750,23 +678,8 @@ def build_data() -> List[Company]:
             "other": 1_526_198,
         },
     ]
-    for exec_data in exxon_executives:
-        person = Person(person_id=person_id_counter, name=exec_data["name"])
-        role = Role(
-            person_id=person_id_counter,
-            company_id=exxon.company_id,
-            title=exec_data["title"],
-            position_type="Executive",
-            year=2023,  # the ERI data corresponds to fiscal 2023
-            contract_years=1,
-            base_salary=exec_data["base_salary"],
-            bonus=exec_data["bonus"],
-            stock_awards=exec_data["stock_awards"],
-            signing_bonus=0.0,
-        )
-        person.add_role(role)
-        exxon.add_executive(person)
-        person_id_counter += 1
+    # the ERI data corresponds to fiscal 2023
+    _add_executives(exxon, exxon_executives, 2023, person_ids)
     companies.append(exxon)
 
     # 9. McKesson
@@ -776,7 +689,7 @@ def build_data() -> List[Company]:
         ticker="MCK",
         sector="Healthcare Distribution",
         founded=1833,
-        board_members=[
+        board_members=(
             "Richard H. Carmona, M.D.",
             "Dominic J. Caruso",
             "W. Roy Dunbar",
@@ -788,7 +701,7 @@ def build_data() -> List[Company]:
             "Kevin M. Ozan",
             "Brian S. Tyler (CEO)",
             "Kathleen Wilson‑Thompson",
-        ],
+        ),
     )
     mckesson_executives = [
         {
@@ -880,27 +793,11 @@ def build_data() -> List[Company]:
             "other": 0.0,
         },
     ]
-    for exec_data in mckesson_executives:
-        person = Person(person_id=person_id_counter, name=exec_data["name"])
-        # Only include compensation details when available.  Many members of
-        # McKesson's Executive Operating Team are not named executive officers
-        # and therefore do not have disclosed compensation.  Their fields are
-        # left at zero.
-        role = Role(
-            person_id=person_id_counter,
-            company_id=mckesson.company_id,
-            title=exec_data["title"],
-            position_type="Executive",
-            year=2024,
-            contract_years=1,
-            base_salary=exec_data["base_salary"],
-            bonus=exec_data["bonus"],
-            stock_awards=exec_data["stock_awards"],
-            signing_bonus=0.0,
-        )
-        person.add_role(role)
-        mckesson.add_executive(person)
-        person_id_counter += 1
+    # Only include compensation details when available.  Many members of
+    # McKesson's Executive Operating Team are not named executive officers
+    # and therefore do not have disclosed compensation.  Their fields are
+    # left at zero.
+    _add_executives(mckesson, mckesson_executives, 2024, person_ids)
     companies.append(mckesson)
 
     # 10. Cencora (formerly AmerisourceBergen)
@@ -910,7 +807,7 @@ def build_data() -> List[Company]:
         ticker="COR",
         sector="Pharmaceutical Distribution & Services",
         founded=1985,
-        board_members=[
+        board_members=(
             "Ornella Barra",
             "Werner Baumann",
             "Frank K. Clyburn",
@@ -922,7 +819,7 @@ def build_data() -> List[Company]:
             "Redonda G. Miller, M.D.",
             "Dennis M. Nally",
             "Lauren M. Tyler",
-        ],
+        ),
     )
     cencora_executives = [
         {
@@ -966,23 +863,7 @@ def build_data() -> List[Company]:
             "other": 92_281,
         },
     ]
-    for exec_data in cencora_executives:
-        person = Person(person_id=person_id_counter, name=exec_data["name"])
-        role = Role(
-            person_id=person_id_counter,
-            company_id=cencora.company_id,
-            title=exec_data["title"],
-            position_type="Executive",
-            year=2024,
-            contract_years=1,
-            base_salary=exec_data["base_salary"],
-            bonus=exec_data["bonus"],
-            stock_awards=exec_data["stock_awards"],
-            signing_bonus=0.0,
-        )
-        person.add_role(role)
-        cencora.add_executive(person)
-        person_id_counter += 1
+    _add_executives(cencora, cencora_executives, 2024, person_ids)
     companies.append(cencora)
 
     return companies
@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import re
 from datetime import date
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Set, Tuple
 
 from fortune10_exec_data import (
     Company as SourceCompany,
@@ -35,6 +36,8 @@ _FINANCIAL_SNAPSHOT: Dict[str, Dict[str, float]] = {
     "McKesson Corporation": {"market_cap": 75_000_000_000, "revenue": 301_500_000_000, "exec_budget": 95_000_000},
     "Chevron Corporation": {"market_cap": 290_000_000_000, "revenue": 246_300_000_000, "exec_budget": 135_000_000},
 }
+# Shared fallback for companies without a snapshot; never mutated.
+_NO_SNAPSHOT: Dict[str, float] = {}
 
 DEFAULT_SOURCE_URL = "https://www.sec.gov/edgar/browse/"
 
@@ -43,29 +46,27 @@ class Fortune10LoadError(RuntimeError):
     """Raised when the curated dataset cannot be converted into league models."""
 
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+# Executives and board members recur across companies; slug each name once.
+@lru_cache(maxsize=2048)
 def _slugify(value: str) -> str:
-    value = value.lower()
-    value = re.sub(r"[^a-z0-9]+", "_", value).strip("_")
-    return value or "unknown"
+    return _SLUG_RE.sub("_", value.lower()).strip("_") or "unknown"
 
 
-def _infer_fiscal_year_end(company: SourceCompany) -> date:
-    years = [
-        role.year
-        for executive in company.executives
-        for role in executive.roles
-    ]
-    fiscal_year = max(years) if years else date.today().year
-    return date(fiscal_year, 12, 31)
+# Every record for a given year carries the same source label; build it once.
+@lru_cache(maxsize=64)
+def _proxy_source(year: int) -> str:
+    return f"{year} Proxy Statement"
 
 
-def _convert_company(source: SourceCompany) -> Company:
-    slug = _slugify(source.name)
-    fiscal_year_end = _infer_fiscal_year_end(source)
-    snapshot = _FINANCIAL_SNAPSHOT.get(source.name, {})
+def _convert_company(source: SourceCompany, company_id: str, latest_role_year: Optional[int]) -> Company:
+    fiscal_year_end = date(latest_role_year or date.today().year, 12, 31)
+    snapshot = _FINANCIAL_SNAPSHOT.get(source.name, _NO_SNAPSHOT)
 
     return Company(
-        company_id=slug,
+        company_id=company_id,
         company_name=source.name,
         ticker=source.ticker,
         fiscal_year_end=fiscal_year_end,
@@ -111,9 +112,9 @@ def _convert_role_to_compensation(
         option_awards_usd=0.0,
         non_equity_incentive_usd=0.0,
         pension_change_usd=0.0,
-        all_other_comp_usd=role.signing_bonus,
+        all_other_comp_usd=role.signing_bonus + role.other_comp,
         total_comp_usd=total_comp,
-        source=f"{role.year} Proxy Statement",
+        source=_proxy_source(role.year),
     )
 
 
@@ -125,13 +126,14 @@ def _attach_board_members(
 ) -> None:
     cash_retainer = 150_000
     stock_grant = 175_000
+    base_comp = cash_retainer + stock_grant
     policy_entries_added = False
+    profiles: List[DirectorProfile] = []
+    director_comps: List[DirectorCompensation] = []
+    policies: List[DirectorCompPolicy] = []
 
     for idx, member_name in enumerate(company.board_members):
         slug = _slugify(member_name)
-        if slug in league.people:
-            continue
-
         person = Person(
             person_id=slug,
             full_name=member_name,
@@ -139,8 +141,10 @@ def _attach_board_members(
             is_director=True,
             status="Active",
         )
-        league.add_person(person)
-        profile = DirectorProfile(
+        # Added immediately so a name repeated on this board is skipped.
+        if not league.add_person_if_absent(person):
+            continue
+        profiles.append(DirectorProfile(
             company_id=company_id,
             person_id=slug,
             role="Director",
@@ -150,30 +154,29 @@ def _attach_board_members(
             committees=None,
             primary_occupation=None,
             other_public_boards=None,
-        )
-        league.add_director_profile(profile)
+        ))
 
-        director_comp = DirectorCompensation(
+        other_comp = 25_000 if idx % 3 == 0 else 0
+        director_comps.append(DirectorCompensation(
             company_id=company_id,
             person_id=slug,
             fiscal_year_end=fiscal_year_end,
             fees_cash_usd=cash_retainer,
             stock_awards_usd=stock_grant,
-            all_other_comp_usd=25_000 if idx % 3 == 0 else 0,
-            total_usd=cash_retainer + stock_grant + (25_000 if idx % 3 == 0 else 0),
+            all_other_comp_usd=other_comp,
+            total_usd=base_comp + other_comp,
             source=f"{fiscal_year_end.year} Proxy Statement (illustrative)",
-        )
-        league.add_director_comp(director_comp)
+        ))
 
         if not policy_entries_added:
-            league.add_director_policy(DirectorCompPolicy(
+            policies.append(DirectorCompPolicy(
                 company_id=company_id,
                 component="Annual Cash Retainer",
                 amount_usd=cash_retainer,
                 unit="USD",
                 notes="Paid quarterly to independent directors.",
             ))
-            league.add_director_policy(DirectorCompPolicy(
+            policies.append(DirectorCompPolicy(
                 company_id=company_id,
                 component="Annual RSU Grant",
                 amount_usd=stock_grant,
@@ -182,40 +185,58 @@ def _attach_board_members(
             ))
             policy_entries_added = True
 
+    league.extend_director_profiles(profiles)
+    league.extend_director_comp(director_comps)
+    league.extend_director_policies(policies)
 
-def _extract_years(compensation: Iterable[ExecutiveCompensation]) -> Set[date]:
-    return {record.fiscal_year_end for record in compensation}
 
+@lru_cache(maxsize=1)
+def load_fortune10_league() -> Tuple[LeagueManager, Tuple[int, ...]]:
+    """Populate a LeagueManager with the curated Fortune 10 dataset.
 
-def load_fortune10_league() -> Tuple[LeagueManager, Set[date]]:
-    """Populate a LeagueManager with the curated Fortune 10 dataset."""
+    Returns the league and the sorted role years seen while loading it. The
+    result is cached and shared between callers, so treat the league as
+    read-only.
+    """
 
     source_companies = build_data()
     if not source_companies:
         raise Fortune10LoadError("fortune10_exec_data.build_data() returned no companies.")
 
     league = LeagueManager()
+    years_seen: Set[int] = set()
 
     for source_company in source_companies:
-        league_company = _convert_company(source_company)
-        league.add_company(league_company)
+        company_id = _slugify(source_company.name)
+        latest_role_year: Optional[int] = None
 
+        people: List[Person] = []
+        compensation_records: List[ExecutiveCompensation] = []
         for source_person in source_company.executives:
             person = _convert_person(source_person)
-            league.add_person(person)
+            people.append(person)
 
             for role in source_person.roles:
+                if latest_role_year is None or role.year > latest_role_year:
+                    latest_role_year = role.year
+                years_seen.add(role.year)
                 compensation = _convert_role_to_compensation(
-                    company_id=league_company.company_id,
+                    company_id=company_id,
                     person_id=person.person_id,
                     role=role,
                 )
-                league.add_executive_comp(compensation)
+                compensation_records.append(compensation)
+
+        # The fiscal year end comes from the roles walked above.
+        league_company = _convert_company(source_company, company_id, latest_role_year)
+        league.add_company(league_company)
 
+        # Executives must be registered before board members are deduplicated.
+        league.extend_people(people)
+        league.extend_executive_comp(compensation_records)
         _attach_board_members(league, source_company, league_company.company_id, league_company.fiscal_year_end)
 
-    available_years = _extract_years(league.executive_comp)
-    return league, available_years
+    return league, tuple(sorted(years_seen))
 
 
 __all__ = ["load_fortune10_league", "Fortune10LoadError"]
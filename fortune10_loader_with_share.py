@@ -17,18 +17,19 @@ does not attempt to calculate current values of stock awards.
 
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass, field, fields
+from typing import Dict, List, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Role:
     """Represents a single role an executive holds at a company.
 
     The ``share_count`` field is optional and represents the number of
     shares (or RSUs/options) granted for equity awards.  When share
     counts were not disclosed in the source materials, this field is
-    set to ``None``.
+    set to ``None``.  Roles are frozen like those in
+    ``fortune10_exec_data.py``; use ``dataclasses.replace`` to revise one.
     """
     person_id: int
     company_id: int
@@ -40,19 +41,27 @@ class Role:
     bonus: float
     stock_awards: float
     signing_bonus: float = 0.0
+    other_comp: float = 0.0
     share_count: Optional[float] = None
+    _total: float = field(init=False, repr=False, compare=False)
 
-    def total_compensation(self) -> float:
-        """Return the sum of all cash and equity compensation."""
-        return (
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_total",
             self.base_salary
             + self.bonus
             + self.stock_awards
             + self.signing_bonus
+            + self.other_comp,
         )
 
+    def total_compensation(self) -> float:
+        """Return the sum of all cash and equity compensation."""
+        return self._total
 
-@dataclass
+
+@dataclass(slots=True)
 class Person:
     """Represents an individual executive and their career history."""
     person_id: int
@@ -71,7 +80,7 @@ class Person:
         return sum(r.total_compensation() for r in self.roles)
 
 
-@dataclass
+@dataclass(slots=True)
 class Company:
     """Represents a company in the Fortune 10 list."""
     company_id: int
@@ -89,6 +98,47 @@ class Company:
         self.executives.append(person)
 
 
+# Share counts disclosed in Walmart’s 2024 proxy statement (see the
+# "Outstanding Equity Awards at Fiscal 2024 Year‑End" table).  Each value is
+# the sum of service‑based restricted stock units that have not vested and
+# performance‑based units that have not yet been earned.
+_WALMART_SHARE_COUNTS: Dict[str, int] = {
+    "Doug McMillon": 1_552_575,  # 1,070,625 unvested + 481,950 unearned
+    "John David Rainey": 910_038,  # 713,361 unvested + 196,677 unearned
+    "Suresh Kumar": 831_276,  # 597,387 + 233,889
+    "John Furner": 831_276,  # 597,387 + 233,889
+    "Kathryn McLay": 699_144,  # 475,884 + 223,260
+    "Chris Nicholas": 452_939,  # 304,100 + 148,839
+}
+
+
+def _share_count(company_name: str, person_name: str) -> Optional[float]:
+    # Everyone outside the Walmart table keeps share_count=None.
+    if company_name == "Walmart Inc.":
+        return _WALMART_SHARE_COUNTS.get(person_name)
+    return None
+
+
+def _copy_role(role, share_count: Optional[float]) -> Role:
+    # Source roles carry exactly our fields minus share_count.
+    values = {f.name: getattr(role, f.name) for f in fields(role) if f.init}
+    return Role(**values, share_count=share_count)
+
+
+def _copy_person(person, company_name: str) -> Person:
+    share_count = _share_count(company_name, person.name)
+    return Person(
+        person_id=person.person_id,
+        name=person.name,
+        age=person.age,
+        experience=person.experience,
+        education=person.education,
+        status=person.status,
+        previous_companies=person.previous_companies,
+        roles=[_copy_role(role, share_count) for role in person.roles],
+    )
+
+
 def build_data() -> List[Company]:
     """Build and return a list of Company objects populated with executives and directors.
 
@@ -99,11 +149,8 @@ def build_data() -> List[Company]:
     """
     from fortune10_exec_data import build_data as build_original
 
-    original_companies = build_original()
-    # Convert original data to include share_count=None
-    new_companies: List[Company] = []
-    for orig in original_companies:
-        new_company = Company(
+    return [
+        Company(
             company_id=orig.company_id,
             name=orig.name,
             ticker=orig.ticker,
@@ -112,58 +159,11 @@ def build_data() -> List[Company]:
             revenue=orig.revenue,
             exec_budget=orig.exec_budget,
             founded=orig.founded,
+            executives=[_copy_person(person, orig.name) for person in orig.executives],
             board_members=list(orig.board_members),
         )
-        # Copy executives and their roles
-        for person in orig.executives:
-            new_person = Person(
-                person_id=person.person_id,
-                name=person.name,
-                age=person.age,
-                experience=person.experience,
-                education=person.education,
-                status=person.status,
-                previous_companies=person.previous_companies,
-            )
-            for role in person.roles:
-                # Set share_count to None by default.  For certain Walmart executives
-                # we provide the number of unvested and unearned shares disclosed in
-                # Walmart’s 2024 proxy statement (see the "Outstanding Equity Awards
-                # at Fiscal 2024 Year‑End" table).  The share_count represents the
-                # sum of service‑based restricted stock units that have not vested
-                # and performance‑based units that have not yet been earned.
-                share_count = None
-                if orig.name == "Walmart Inc.":
-                    # assign share counts based on the executive's name
-                    if person.name == "Doug McMillon":
-                        share_count = 1_552_575  # 1,070,625 unvested + 481,950 unearned
-                    elif person.name == "John David Rainey":
-                        share_count = 910_038  # 713,361 unvested + 196,677 unearned
-                    elif person.name == "Suresh Kumar":
-                        share_count = 831_276  # 597,387 + 233,889
-                    elif person.name == "John Furner":
-                        share_count = 831_276  # 597,387 + 233,889
-                    elif person.name == "Kathryn McLay":
-                        share_count = 699_144  # 475,884 + 223,260
-                    elif person.name == "Chris Nicholas":
-                        share_count = 452_939  # 304,100 + 148,839
-                new_role = Role(
-                    person_id=role.person_id,
-                    company_id=role.company_id,
-                    title=role.title,
-                    position_type=role.position_type,
-                    year=role.year,
-                    contract_years=role.contract_years,
-                    base_salary=role.base_salary,
-                    bonus=role.bonus,
-                    stock_awards=role.stock_awards,
-                    signing_bonus=role.signing_bonus,
-                    share_count=share_count,
-                )
-                new_person.add_role(new_role)
-            new_company.add_executive(new_person)
-        new_companies.append(new_company)
-    return new_companies
+        for orig in build_original()
+    ]
 
 
 if __name__ == "__main__":
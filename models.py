@@ -1,9 +1,11 @@
 # models.py - normalized core schema for ExecuCap
 from __future__ import annotations
 
+import heapq
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Dict, List, Optional, Tuple
+from operator import attrgetter
+from typing import Dict, Iterable, List, Optional, Tuple, ValuesView
 
 
 # ---------------------------------------------------------------------------
@@ -11,7 +13,7 @@ from typing import Dict, List, Optional, Tuple
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Company:
     """Represents a public company covered by the dataset."""
 
@@ -28,7 +30,7 @@ class Company:
     founded_year: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """Represents an executive or director."""
 
@@ -50,7 +52,7 @@ class Person:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutiveCompensation:
     """Summary Compensation Table entry for a named executive officer."""
 
@@ -68,7 +70,7 @@ class ExecutiveCompensation:
     source: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutiveEquityGrant:
     """Plan-based award (RSU/PSU/Option) issued to an executive."""
 
@@ -84,7 +86,7 @@ class ExecutiveEquityGrant:
     source: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class BeneficialOwnershipRecord:
     """Ownership disclosure from the proxy statement."""
 
@@ -99,7 +101,7 @@ class BeneficialOwnershipRecord:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectorCompensation:
     """Director compensation table entry."""
 
@@ -113,7 +115,7 @@ class DirectorCompensation:
     source: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectorProfile:
     """Director biography and governance metadata."""
 
@@ -128,7 +130,7 @@ class DirectorProfile:
     other_public_boards: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectorCompPolicy:
     """Board compensation policy components."""
 
@@ -139,7 +141,7 @@ class DirectorCompPolicy:
     notes: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceManifestEntry:
     """Metadata about source files used to populate the dataset."""
 
@@ -149,6 +151,11 @@ class SourceManifestEntry:
     last_updated: date
 
 
+# Sort keys for compensation records; attrgetter skips a Python-level call per item.
+_BY_FISCAL_YEAR_END = attrgetter("fiscal_year_end")
+_BY_TOTAL_COMP = attrgetter("total_comp_usd")
+
+
 # ---------------------------------------------------------------------------
 # Aggregate / Repository
 # ---------------------------------------------------------------------------
@@ -164,8 +171,17 @@ class LeagueManager:
         self.companies: Dict[str, Company] = {}
         self.people: Dict[str, Person] = {}
 
-        # Compensation datasets
-        self.executive_comp: List[ExecutiveCompensation] = []
+        # Compensation datasets; executive comp is keyed by
+        # (company_id, person_id, fiscal_year_end) so re-imports upsert in place.
+        self._exec_comp_index: Dict[Tuple[str, str, date], ExecutiveCompensation] = {}
+        # Same records grouped by company, person and fiscal year, kept in step on insert.
+        self._exec_comp_by_company: Dict[str, Dict[Tuple[str, str, date], ExecutiveCompensation]] = {}
+        self._exec_comp_by_person: Dict[str, Dict[Tuple[str, str, date], ExecutiveCompensation]] = {}
+        self._exec_comp_by_year: Dict[Optional[int], Dict[Tuple[str, str, date], ExecutiveCompensation]] = {}
+        # Distinct fiscal year ends, built on first read and dropped on insert.
+        # Like the indexes above it relies on every change going through
+        # add_executive_comp; records must not be edited in place.
+        self._available_years: Optional[List[date]] = None
         self.equity_grants: List[ExecutiveEquityGrant] = []
         self.director_comp: List[DirectorCompensation] = []
         self.beneficial_ownership: List[BeneficialOwnershipRecord] = []
@@ -173,8 +189,10 @@ class LeagueManager:
         self.director_policies: List[DirectorCompPolicy] = []
         self.source_manifest: List[SourceManifestEntry] = []
 
-        # Derived indexes for quick lookups
-        self._exec_comp_index: Dict[Tuple[str, str, date], ExecutiveCompensation] = {}
+    @property
+    def executive_comp(self) -> ValuesView[ExecutiveCompensation]:
+        """Live view of executive compensation records in insertion order."""
+        return self._exec_comp_index.values()
 
     # ------------------------------------------------------------------
     # Entity registration helpers
@@ -186,17 +204,22 @@ class LeagueManager:
     def add_person(self, person: Person) -> None:
         self.people[person.person_id] = person
 
+    def add_person_if_absent(self, person: Person) -> bool:
+        """Register ``person`` unless the id is taken; return True if it was added."""
+        return self.people.setdefault(person.person_id, person) is person
+
     def add_executive_comp(self, record: ExecutiveCompensation) -> None:
+        self._available_years = None
         key = (record.company_id, record.person_id, record.fiscal_year_end)
-        existing = self._exec_comp_index.get(key)
-        if existing:
-            self.executive_comp = [
-                r
-                for r in self.executive_comp
-                if not (r.company_id == record.company_id and r.person_id == record.person_id and r.fiscal_year_end == record.fiscal_year_end)
-            ]
-        self._exec_comp_index[key] = record
-        self.executive_comp.append(record)
+        # A replacement moves to the end, as if the old record had been dropped.
+        for records in (
+            self._exec_comp_index,
+            self._exec_comp_by_company.setdefault(record.company_id, {}),
+            self._exec_comp_by_person.setdefault(record.person_id, {}),
+            self._exec_comp_by_year.setdefault(record.fiscal_year_end.year if record.fiscal_year_end else None, {}),
+        ):
+            records.pop(key, None)
+            records[key] = record
 
     def add_equity_grant(self, record: ExecutiveEquityGrant) -> None:
         self.equity_grants.append(record)
@@ -216,6 +239,36 @@ class LeagueManager:
     def add_source_manifest_entry(self, entry: SourceManifestEntry) -> None:
         self.source_manifest.append(entry)
 
+    # ------------------------------------------------------------------
+    # Bulk registration helpers (one call per staged file or dataset)
+    # ------------------------------------------------------------------
+
+    def extend_people(self, people: Iterable[Person]) -> None:
+        self.people.update((person.person_id, person) for person in people)
+
+    def extend_executive_comp(self, records: Iterable[ExecutiveCompensation]) -> None:
+        add_executive_comp = self.add_executive_comp
+        for record in records:
+            add_executive_comp(record)
+
+    def extend_equity_grants(self, records: Iterable[ExecutiveEquityGrant]) -> None:
+        self.equity_grants.extend(records)
+
+    def extend_beneficial_ownership(self, records: Iterable[BeneficialOwnershipRecord]) -> None:
+        self.beneficial_ownership.extend(records)
+
+    def extend_director_comp(self, records: Iterable[DirectorCompensation]) -> None:
+        self.director_comp.extend(records)
+
+    def extend_director_profiles(self, profiles: Iterable[DirectorProfile]) -> None:
+        self.director_profiles.extend(profiles)
+
+    def extend_director_policies(self, policies: Iterable[DirectorCompPolicy]) -> None:
+        self.director_policies.extend(policies)
+
+    def extend_source_manifest(self, entries: Iterable[SourceManifestEntry]) -> None:
+        self.source_manifest.extend(entries)
+
     # ------------------------------------------------------------------
     # Query helpers used by the web layer
     # ------------------------------------------------------------------
@@ -231,45 +284,46 @@ class LeagueManager:
         person_id: str,
         fiscal_year: Optional[date] = None,
     ) -> List[ExecutiveCompensation]:
-        records = [r for r in self.executive_comp if r.person_id == person_id]
+        records = self._exec_comp_by_person.get(person_id, {}).values()
         if fiscal_year:
             target_year = fiscal_year.year
             records = [
                 r for r in records
                 if r.fiscal_year_end and r.fiscal_year_end.year == target_year
             ]
-        return sorted(records, key=lambda r: r.fiscal_year_end, reverse=True)
+        return sorted(records, key=_BY_FISCAL_YEAR_END, reverse=True)
 
     def get_company_compensation(
         self,
         company_id: str,
         fiscal_year: Optional[date] = None,
     ) -> List[ExecutiveCompensation]:
-        records = [r for r in self.executive_comp if r.company_id == company_id]
+        records = self._exec_comp_by_company.get(company_id, {}).values()
         if fiscal_year:
             target_year = fiscal_year.year
             records = [
                 r for r in records
                 if r.fiscal_year_end and r.fiscal_year_end.year == target_year
             ]
-        return sorted(records, key=lambda r: r.total_comp_usd, reverse=True)
+        return sorted(records, key=_BY_TOTAL_COMP, reverse=True)
 
     def get_top_earners(
         self,
         fiscal_year: Optional[date] = None,
         limit: int = 10,
     ) -> List[ExecutiveCompensation]:
-        records = self.executive_comp
-        if fiscal_year:
-            target_year = fiscal_year.year
-            records = [
-                r for r in records
-                if r.fiscal_year_end and r.fiscal_year_end.year == target_year
-            ]
-        return sorted(records, key=lambda r: r.total_comp_usd, reverse=True)[:limit]
+        records = self._exec_comp_for_year(fiscal_year)
+        return heapq.nlargest(limit, records, key=_BY_TOTAL_COMP)
+
+    def _exec_comp_for_year(self, fiscal_year: Optional[date]) -> Iterable[ExecutiveCompensation]:
+        if not fiscal_year:
+            return self._exec_comp_index.values()
+        return self._exec_comp_by_year.get(fiscal_year.year, {}).values()
 
     def get_available_years(self) -> List[date]:
-        return sorted({record.fiscal_year_end for record in self.executive_comp}, reverse=True)
+        if self._available_years is None:
+            self._available_years = sorted({record.fiscal_year_end for record in self.executive_comp}, reverse=True)
+        return list(self._available_years)
 
     def get_director_profiles_for_company(self, company_id: str) -> List[DirectorProfile]:
         return [profile for profile in self.director_profiles if profile.company_id == company_id]
@@ -326,19 +380,18 @@ class LeagueManager:
         return over_budget
 
     def get_league_statistics(self, fiscal_year: Optional[date] = None) -> Dict[str, float]:
-        records = self.executive_comp
-        if fiscal_year:
-            target_year = fiscal_year.year
-            records = [
-                r for r in records
-                if r.fiscal_year_end and r.fiscal_year_end.year == target_year
-            ]
+        records = self._exec_comp_for_year(fiscal_year)
 
         total_spent = sum(r.total_comp_usd for r in records)
+        # One snapshot per company rather than two per record.
+        budget_by_company = {
+            company_id: self.get_company_cap_snapshot(company_id, fiscal_year).get("budget")
+            for company_id in {r.company_id for r in records}
+        }
         budgets = [
-            self.get_company_cap_snapshot(r.company_id, fiscal_year)["budget"]
+            budget_by_company[r.company_id]
             for r in records
-            if self.get_company_cap_snapshot(r.company_id, fiscal_year).get("budget")
+            if budget_by_company[r.company_id]
         ]
         total_budget = sum(budgets) if budgets else 0.0
         avg_utilization = (total_spent / total_budget * 100) if total_budget else 100.0
@@ -0,0 +1,365 @@
+import base64
+import csv
+import hashlib
+import io
+import json
+import threading
+from datetime import date
+
+import pytest
+
+import company_folder_loader
+from company_folder_loader import (
+    CompanyFolderLoader,
+    _decode_lines,
+    _parse_date,
+    _read_rows,
+    _to_float,
+    _to_int,
+)
+
+
+MANIFEST = "companies/walmart/2024/walmart_2024_manifest.csv"
+EXEC_COMP = "companies/walmart/2024/walmart_2024_executive_compensation.csv"
+
+
+class StubBlob:
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+        self.md5_hash = base64.b64encode(hashlib.md5(data).digest()).decode()
+        self.downloads = 0
+
+    def open(self, mode="rb"):
+        self.downloads += 1
+        return io.BytesIO(self.data)
+
+    def download_to_filename(self, filename):
+        self.downloads += 1
+        with open(filename, "wb") as handle:
+            handle.write(self.data)
+
+
+class _ResetStream(io.RawIOBase):
+    """Serves the first chunk, then fails like a dropped connection."""
+
+    def __init__(self, data):
+        self._data = data
+        self._served = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._served:
+            raise ConnectionError("connection reset")
+        self._served = True
+        buffer[:len(self._data)] = self._data
+        return len(self._data)
+
+
+class ResetBlob(StubBlob):
+    def open(self, mode="rb"):
+        self.downloads += 1
+        return _ResetStream(self.data)
+
+
+class StubBucket:
+    def __init__(self):
+        self.blobs = {}
+
+    def add(self, name, data, blob_class=StubBlob):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self.blobs[name] = blob_class(name, data)
+        return self.blobs[name]
+
+    def list_blobs(self, prefix="", **kwargs):
+        return [blob for name, blob in sorted(self.blobs.items()) if name.startswith(prefix)]
+
+
+class StubClient:
+    def __init__(self, bucket):
+        self._bucket = bucket
+
+    def bucket(self, name):
+        return self._bucket
+
+    def list_blobs(self, bucket, match_glob=None, **kwargs):
+        return [
+            blob for name, blob in sorted(bucket.blobs.items())
+            if name.startswith("companies/") and name.lower().endswith(".csv")
+        ]
+
+
+@pytest.fixture
+def bucket(monkeypatch):
+    stub = StubBucket()
+    monkeypatch.setattr(company_folder_loader, "_storage_client", lambda credentials_path: StubClient(stub))
+    stub.add(MANIFEST, "company_name,ticker,fiscal_year_end,sector\nWalmart Inc.,WMT,1/31/2024,Retail\n")
+    stub.add(
+        EXEC_COMP,
+        "full_name,title,salary_usd,bonus_usd,stock_awards_usd,total_comp_usd\n"
+        'Doug McMillon,CEO,"$1,505,000",N/A,20375000,\n'
+        "John Rainey,CFO,1033000,n/a,11752000,15285837\n",
+    )
+    return stub
+
+
+def _comp_by_person(result):
+    return {record.person_id: record for record in result["league_manager"].executive_comp}
+
+
+# ---------------------------------------------------------------------------
+# Value parsing
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("$1,505,000", 1505000.0),
+        (" 2,500.50 ", 2500.5),
+        ("N/A", 0.0),
+        ("na", 0.0),
+        ("None", 0.0),
+        ("", 0.0),
+        (None, 0.0),
+        ("n.m.", 0.0),
+        (12, 12.0),
+        (3.5, 3.5),
+    ],
+)
+def test_to_float(value, expected):
+    assert _to_float(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("1,000,000", 1000000),
+        ("2008.0", 2008),
+        ("N/A", 0),
+        ("", 0),
+        (None, 0),
+        ("unknown", 0),
+        (7, 7),
+    ],
+)
+def test_to_int(value, expected):
+    assert _to_int(value) == expected
+
+
+FALLBACK = date(1999, 12, 31)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2024-01-05", date(2024, 1, 5)),
+        ("2024-1-5", date(2024, 1, 5)),
+        (" 2024-01-31 ", date(2024, 1, 31)),
+        ("1/5/2024", date(2024, 1, 5)),
+        ("01/31/2024", date(2024, 1, 31)),
+        ("20240131", date(2024, 1, 31)),
+        ("2024-02-30", FALLBACK),
+        ("13/01/2024", FALLBACK),
+        ("Jan 31 2024", FALLBACK),
+        ("", FALLBACK),
+        (None, FALLBACK),
+    ],
+)
+def test_parse_date(value, expected):
+    assert _parse_date(value, fallback=FALLBACK) == expected
+
+
+# ---------------------------------------------------------------------------
+# CSV decoding
+# ---------------------------------------------------------------------------
+
+
+def _dict_reader_rows(text):
+    reader = csv.DictReader(io.StringIO(text))
+    return [
+        {
+            (k.strip() if isinstance(k, str) else k): (v.strip() if isinstance(v, str) else v)
+            for k, v in row.items()
+        }
+        for row in reader
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "a,b,c\n1,2,3\n",
+        " a , b \n 1 , 2 \n",
+        "a,b,c\n1\n",
+        "a,b\n1,2,3,4\n",
+        "a,b,a\n1,2,3\n",
+        "a, a,b\n1,2\n",
+        "a,b\n\n1,2\n\n",
+        'a,b\n"multi\nline",2\n',
+        "a,b\n",
+        "",
+    ],
+)
+def test_read_rows_matches_dict_reader(text):
+    assert list(_read_rows(io.StringIO(text))) == _dict_reader_rows(text)
+
+
+def test_decode_lines_falls_back_to_latin1_per_line():
+    lines = ["name\n".encode("utf-8"), "José\n".encode("latin-1"), "Zoë\n".encode("utf-8")]
+    assert list(_decode_lines(lines)) == ["name\n", "José\n", "Zoë\n"]
+
+
+# ---------------------------------------------------------------------------
+# Loading
+# ---------------------------------------------------------------------------
+
+
+def test_load_parses_currency_na_and_dates(bucket):
+    result = CompanyFolderLoader("execap").load_all_company_data()
+
+    assert result["status"] == "success"
+    company = result["league_manager"].get_company("walmart")
+    assert (company.ticker, company.sector, company.fiscal_year_end) == ("WMT", "Retail", date(2024, 1, 31))
+    comp = _comp_by_person(result)
+    ceo = comp["doug_mcmillon"]
+    assert (ceo.salary_usd, ceo.bonus_usd, ceo.stock_awards_usd) == (1505000.0, 0.0, 20375000.0)
+    # A blank total is rebuilt from the components.
+    assert ceo.total_comp_usd == 1505000.0 + 20375000.0
+    assert comp["john_rainey"].total_comp_usd == 15285837.0
+    assert ceo.fiscal_year_end == date(2024, 12, 31)
+
+
+def test_duplicate_executive_rows_upsert(bucket):
+    bucket.add(
+        EXEC_COMP,
+        "full_name,title,salary_usd,fiscal_year_end\n"
+        "Doug McMillon,CEO,100,2024-1-31\n"
+        "John Rainey,CFO,50,2024-01-31\n"
+        "Doug McMillon,CEO,200,01/31/2024\n",
+    )
+    result = CompanyFolderLoader("execap").load_all_company_data()
+
+    records = list(result["league_manager"].executive_comp)
+    assert [(r.person_id, r.salary_usd) for r in records] == [("john_rainey", 50.0), ("doug_mcmillon", 200.0)]
+    assert result["executive_comp_count"] == 2
+
+
+def test_latin1_file_loads(bucket):
+    bucket.add(EXEC_COMP, "full_name,title,salary_usd\nJosé Núñez,CFO,10\n".encode("latin-1"))
+    result = CompanyFolderLoader("execap").load_all_company_data()
+
+    assert result["league_manager"].get_person("jos_n_ez").full_name == "José Núñez"
+
+
+def test_interrupted_download_drops_the_whole_file(bucket):
+    data = "full_name,title,salary_usd\nDoug McMillon,CEO,10\n"
+    bucket.add(EXEC_COMP, data, blob_class=ResetBlob)
+    result = CompanyFolderLoader("execap").load_all_company_data()
+
+    assert result["executive_comp_count"] == 0
+    assert any(w.startswith(f"Failed to download {EXEC_COMP}") for w in result["warnings"])
+
+
+def test_parse_error_is_not_reported_as_download_failure(bucket):
+    # csv rejects fields beyond csv.field_size_limit() (128 KiB by default).
+    bucket.add(EXEC_COMP, "full_name,title\nDoug McMillon,CEO\n" + "x" * 200_000 + ",CFO\n")
+    result = CompanyFolderLoader("execap").load_all_company_data()
+
+    assert result["executive_comp_count"] == 0
+    assert any(w.startswith(f"Failed to parse {EXEC_COMP}") for w in result["warnings"])
+
+
+def test_reload_is_served_from_disk_cache(bucket, tmp_path):
+    loader = CompanyFolderLoader("execap", cache_dir=str(tmp_path))
+    first = loader.load_all_company_data()
+    second = loader.load_all_company_data()
+
+    assert _comp_by_person(first).keys() == _comp_by_person(second).keys()
+    assert [blob.downloads for blob in bucket.blobs.values()] == [1, 1]
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert sorted(index) == [EXEC_COMP, MANIFEST]
+    assert all((tmp_path / filename).exists() for filename in index.values())
+
+    # A fresh loader picks up the index written by the previous one.
+    CompanyFolderLoader("execap", cache_dir=str(tmp_path)).load_all_company_data()
+    assert [blob.downloads for blob in bucket.blobs.values()] == [1, 1]
+
+
+def test_same_file_in_two_folders_keeps_separate_cache_copies(bucket, tmp_path):
+    data = bucket.blobs[EXEC_COMP].data
+    other = "companies/target/2024/target_2024_executive_compensation.csv"
+    bucket.add(other, data)
+    loader = CompanyFolderLoader("execap", cache_dir=str(tmp_path))
+    loader.load_all_company_data()
+
+    bucket.add(EXEC_COMP, "full_name,title,salary_usd\nDoug McMillon,CEO,1\n")
+    loader.load_all_company_data()
+
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert index[other] != index[EXEC_COMP]
+    assert (tmp_path / index[other]).read_bytes() == data
+
+
+def test_changed_and_deleted_blobs_are_pruned_from_cache(bucket, tmp_path):
+    loader = CompanyFolderLoader("execap", cache_dir=str(tmp_path))
+    loader.load_all_company_data()
+    old_index = json.loads((tmp_path / "index.json").read_text())
+
+    bucket.add(EXEC_COMP, "full_name,title,salary_usd\nDoug McMillon,CEO,1\n")
+    del bucket.blobs[MANIFEST]
+    result = loader.load_all_company_data()
+
+    assert _comp_by_person(result)["doug_mcmillon"].salary_usd == 1.0
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert sorted(index) == [EXEC_COMP]
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted([index[EXEC_COMP], "index.json"])
+    assert not (tmp_path / old_index[MANIFEST]).exists()
+    assert not (tmp_path / old_index[EXEC_COMP]).exists()
+
+
+def test_prefetch_window_is_bounded(bucket, monkeypatch):
+    for slug in ("amazon", "apple", "cvs"):
+        bucket.add(f"companies/{slug}/2024/{slug}_2024_executive_compensation.csv", bucket.blobs[EXEC_COMP].data)
+    loader = CompanyFolderLoader("execap")
+    in_flight = []
+    inline_fetches = []
+    prefetch_more = loader._prefetch_more
+    fetch_csv_rows = loader._fetch_csv_rows
+    caller = threading.current_thread()
+
+    def recording_prefetch_more():
+        prefetch_more()
+        in_flight.append(len(loader._prefetched))
+
+    def recording_fetch(blob):
+        if threading.current_thread() is caller:
+            inline_fetches.append(blob.name)
+        return fetch_csv_rows(blob)
+
+    monkeypatch.setattr(loader, "_prefetch_more", recording_prefetch_more)
+    monkeypatch.setattr(loader, "_fetch_csv_rows", recording_fetch)
+    result = loader.load_all_company_data(max_workers=2)
+
+    assert result["companies_count"] == 4
+    assert max(in_flight) == 2
+    assert inline_fetches == []
+
+
+def test_overlapping_loads_on_one_loader_both_succeed(bucket):
+    loader = CompanyFolderLoader("execap")
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(loader.load_all_company_data()))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [r["status"] for r in results] == ["success", "success"]
+    assert [r["executive_comp_count"] for r in results] == [2, 2]
@@ -0,0 +1,110 @@
+from datetime import date
+
+import pytest
+
+from models import ExecutiveCompensation, LeagueManager
+
+
+FY2023 = date(2023, 12, 31)
+FY2024 = date(2024, 12, 31)
+
+
+def _comp(company_id, person_id, fiscal_year_end, total):
+    return ExecutiveCompensation(
+        company_id=company_id,
+        person_id=person_id,
+        fiscal_year_end=fiscal_year_end,
+        total_comp_usd=total,
+    )
+
+
+@pytest.fixture
+def manager():
+    league = LeagueManager()
+    league.extend_executive_comp([
+        _comp("walmart", "ceo_a", FY2023, 20.0),
+        _comp("walmart", "cfo_b", FY2023, 8.0),
+        _comp("walmart", "ceo_a", FY2024, 25.0),
+        _comp("amazon", "ceo_c", FY2024, 30.0),
+        _comp("amazon", "cfo_d", FY2024, 5.0),
+    ])
+    return league
+
+
+def _keys(records):
+    return [(r.company_id, r.person_id, r.fiscal_year_end) for r in records]
+
+
+def test_reinsert_replaces_record_and_moves_it_to_the_end(manager):
+    replacement = _comp("walmart", "ceo_a", FY2023, 21.0)
+    manager.add_executive_comp(replacement)
+
+    records = list(manager.executive_comp)
+    assert len(records) == 5
+    assert records[-1] is replacement
+    assert _keys(records) == [
+        ("walmart", "cfo_b", FY2023),
+        ("walmart", "ceo_a", FY2024),
+        ("amazon", "ceo_c", FY2024),
+        ("amazon", "cfo_d", FY2024),
+        ("walmart", "ceo_a", FY2023),
+    ]
+
+
+def test_company_compensation_is_grouped_and_ranked(manager):
+    assert _keys(manager.get_company_compensation("walmart")) == [
+        ("walmart", "ceo_a", FY2024),
+        ("walmart", "ceo_a", FY2023),
+        ("walmart", "cfo_b", FY2023),
+    ]
+    assert _keys(manager.get_company_compensation("walmart", FY2023)) == [
+        ("walmart", "ceo_a", FY2023),
+        ("walmart", "cfo_b", FY2023),
+    ]
+    assert manager.get_company_compensation("unknown") == []
+
+
+def test_person_compensation_is_grouped_newest_first(manager):
+    assert _keys(manager.get_compensation_for_person("ceo_a")) == [
+        ("walmart", "ceo_a", FY2024),
+        ("walmart", "ceo_a", FY2023),
+    ]
+    assert _keys(manager.get_compensation_for_person("ceo_a", FY2023)) == [
+        ("walmart", "ceo_a", FY2023),
+    ]
+    assert manager.get_compensation_for_person("unknown") == []
+
+
+def test_top_earners_by_year(manager):
+    assert [r.total_comp_usd for r in manager.get_top_earners(limit=3)] == [30.0, 25.0, 20.0]
+    assert [r.total_comp_usd for r in manager.get_top_earners(FY2023)] == [20.0, 8.0]
+    # Any date within the fiscal year selects the same records.
+    assert [r.total_comp_usd for r in manager.get_top_earners(date(2024, 6, 30), limit=2)] == [30.0, 25.0]
+    assert manager.get_top_earners(date(2019, 12, 31)) == []
+
+
+def test_available_years_newest_first(manager):
+    assert manager.get_available_years() == [FY2024, FY2023]
+    assert LeagueManager().get_available_years() == []
+
+
+def test_reads_reflect_a_reinsert(manager):
+    # Warm every read path before the write.
+    manager.get_available_years()
+    manager.get_top_earners(FY2023)
+    manager.get_company_compensation("walmart", FY2023)
+
+    manager.add_executive_comp(_comp("walmart", "cfo_b", FY2023, 50.0))
+    manager.add_executive_comp(_comp("amazon", "ceo_c", date(2022, 12, 31), 12.0))
+
+    assert [r.total_comp_usd for r in manager.get_top_earners(FY2023)] == [50.0, 20.0]
+    assert manager.get_top_earners(limit=1)[0].person_id == "cfo_b"
+    assert [r.total_comp_usd for r in manager.get_company_compensation("walmart", FY2023)] == [50.0, 20.0]
+    assert manager.get_available_years() == [FY2024, FY2023, date(2022, 12, 31)]
+    assert len(manager.executive_comp) == 6
+
+
+def test_available_years_returns_a_copy(manager):
+    years = manager.get_available_years()
+    years.clear()
+    assert manager.get_available_years() == [FY2024, FY2023]